@@ -29,7 +29,7 @@ def load_content():
         path = os.path.join(os.path.dirname(__file__), CONTENT_FILE)
         
         if not os.path.exists(path):
-            logger.info(f"Content file not found. Creating {CONTENT_FILE}")
+            logger.info("Content file not found. Creating %s", CONTENT_FILE)
             logger.info("Content file created successfully")
             
         with open(path, "r", encoding="utf-8") as f:
@@ -37,10 +37,36 @@ def load_content():
             return data
             
     except Exception as e:
-        logger.error(f"Error managing content file: {e}")
+        logger.error("Error managing content file: %s", e)
         return []
 
 COURSE_CONTENT = load_content()
+TOPICS_BY_ID = {t["id"]: t for t in COURSE_CONTENT}
+AVAILABLE_TOPICS = ", ".join([f"'{t['id']}'" for t in COURSE_CONTENT])
+
+MODE_CONFIG = {
+    "learn": {
+        "voice": "en-US-matthew",
+        "style": "Promo",
+        "persona": "Matthew",
+        "introduction": "Welcome! I'm Matthew, your knowledge architect. Think of me as your personal guide through the fascinating world of {title}. I've spent years breaking down complex concepts into digestible insights, and I'm here to make this topic crystal clear for you. Let me paint you a comprehensive picture of what you're about to master.",
+        "instruction": "You are Matthew - confident, articulate, and passionate about teaching. You have a gift for making complex ideas accessible. Use storytelling, real-world analogies, and progressive disclosure to build understanding layer by layer. Explain: {summary}"
+    },
+    "quiz": {
+        "voice": "en-US-alicia",
+        "style": "Conversational",
+        "persona": "Alicia",
+        "introduction": "Hello! I'm Alicia, and I'll be your challenge partner today. I believe that true understanding reveals itself when you apply what you've learned. I'm not here to trick you - I'm here to help you discover how well you've internalized {title}. Think of this as a friendly conversation where we explore your understanding together. Ready?",
+        "instruction": "You are Alicia - encouraging yet rigorous, warm yet precise. You create a safe space for learning through assessment. Ask the question naturally, then listen carefully to their response. Probe deeper with follow-up questions if needed. Celebrate what they get right and gently guide them when they struggle. Question: {sample_question}"
+    },
+    "teach_back": {
+        "voice": "en-US-ken",
+        "style": "Promo",
+        "persona": "Ken",
+        "introduction": "Hey there! I'm Ken, and I'm genuinely curious to learn about {title} from you. You know what they say - teaching is the ultimate test of understanding. I'm going to be your eager student, asking questions when I'm confused, nodding along when things click. Pretend I'm a friend who knows nothing about this topic. Can you break it down for me?",
+        "instruction": "You are Ken - curious, engaged, and authentically interested in learning. You're not pretending to be confused - you genuinely want to understand through their explanation. Ask clarifying questions like a real student would. Show enthusiasm when they explain things well. After they finish their complete explanation, use the evaluate_teaching tool to provide comprehensive, constructive feedback. Reference: {summary}"
+    }
+}
 
 @dataclass
 class TutorState:
@@ -49,7 +75,7 @@ class TutorState:
     mode: Literal["learn", "quiz", "teach_back"] = "learn"
     
     def set_topic(self, topic_id: str) -> bool:
-        topic = next((item for item in COURSE_CONTENT if item["id"] == topic_id), None)
+        topic = TOPICS_BY_ID.get(topic_id)
         if topic:
             self.current_topic_id = topic_id
             self.current_topic_data = topic
@@ -77,8 +103,7 @@ async def select_topic(
         topic_title = state.current_topic_data["title"]
         return f"Topic successfully set to '{topic_title}'. Please ask the user which learning mode they prefer: Learn, Quiz, or Teach Back."
     else:
-        available_topics = ", ".join([f"'{t['id']}'" for t in COURSE_CONTENT])
-        return f"Topic '{topic_id}' not found. Available topics: {available_topics}"
+        return f"Topic '{topic_id}' not found. Available topics: {AVAILABLE_TOPICS}"
 
 @function_tool
 async def set_learning_mode(
@@ -100,38 +125,17 @@ async def set_learning_mode(
     if not state.current_topic_data:
         return "Error: No topic selected. Please select a topic before choosing a learning mode."
     
-    mode_config = {
-        "learn": {
-            "voice": "en-US-matthew",
-            "style": "Promo",
-            "persona": "Matthew",
-            "introduction": f"Welcome! I'm Matthew, your knowledge architect. Think of me as your personal guide through the fascinating world of {state.current_topic_data['title']}. I've spent years breaking down complex concepts into digestible insights, and I'm here to make this topic crystal clear for you. Let me paint you a comprehensive picture of what you're about to master.",
-            "instruction": f"You are Matthew - confident, articulate, and passionate about teaching. You have a gift for making complex ideas accessible. Use storytelling, real-world analogies, and progressive disclosure to build understanding layer by layer. Explain: {state.current_topic_data['summary']}"
-        },
-        "quiz": {
-            "voice": "en-US-alicia",
-            "style": "Conversational",
-            "persona": "Alicia",
-            "introduction": f"Hello! I'm Alicia, and I'll be your challenge partner today. I believe that true understanding reveals itself when you apply what you've learned. I'm not here to trick you - I'm here to help you discover how well you've internalized {state.current_topic_data['title']}. Think of this as a friendly conversation where we explore your understanding together. Ready?",
-            "instruction": f"You are Alicia - encouraging yet rigorous, warm yet precise. You create a safe space for learning through assessment. Ask the question naturally, then listen carefully to their response. Probe deeper with follow-up questions if needed. Celebrate what they get right and gently guide them when they struggle. Question: {state.current_topic_data['sample_question']}"
-        },
-        "teach_back": {
-            "voice": "en-US-ken",
-            "style": "Promo",
-            "persona": "Ken",
-            "introduction": f"Hey there! I'm Ken, and I'm genuinely curious to learn about {state.current_topic_data['title']} from you. You know what they say - teaching is the ultimate test of understanding. I'm going to be your eager student, asking questions when I'm confused, nodding along when things click. Pretend I'm a friend who knows nothing about this topic. Can you break it down for me?",
-            "instruction": f"You are Ken - curious, engaged, and authentically interested in learning. You're not pretending to be confused - you genuinely want to understand through their explanation. Ask clarifying questions like a real student would. Show enthusiasm when they explain things well. After they finish their complete explanation, use the evaluate_teaching tool to provide comprehensive, constructive feedback. Reference: {state.current_topic_data['summary']}"
-        }
-    }
-    
-    config = mode_config.get(state.mode)
+    config = MODE_CONFIG.get(state.mode)
     if not config:
         return f"Error: Invalid mode '{state.mode}'"
     
+    introduction = config["introduction"].format(**state.current_topic_data)
+    instruction = config["instruction"].format(**state.current_topic_data)
+    
     agent_session.tts.update_options(voice=config["voice"], style=config["style"])
-    logger.info(f"Mode transition: {state.mode.upper()} - Persona: {config['persona']}")
+    logger.info("Mode transition: %s - Persona: %s", state.mode.upper(), config["persona"])
     
-    return f"PERSONA ACTIVATION: You are now {config['persona']}. Start by saying: '{config['introduction']}' Then continue with: {config['instruction']}"
+    return f"PERSONA ACTIVATION: You are now {config['persona']}. Start by saying: '{introduction}' Then continue with: {instruction}"
 
 @function_tool
 async def evaluate_teaching(
@@ -147,7 +151,7 @@ async def evaluate_teaching(
     if not state.current_topic_data:
         return "Error: No active topic to evaluate against."
     
-    logger.info(f"Evaluating explanation for topic: {state.current_topic_id}")
+    logger.info("Evaluating explanation for topic: %s", state.current_topic_id)
     
     evaluation_prompt = f"""
     You are Ken, and you've just listened carefully to your student teach you about {state.current_topic_data['title']}.
@@ -203,11 +207,7 @@ async def evaluate_teaching(
     
     return evaluation_prompt
 
-class TutorAgent(Agent):
-    def __init__(self):
-        topic_list = ", ".join([f"'{t['id']}' ({t['title']})" for t in COURSE_CONTENT])
-        
-        instructions = f"""You are the Coordinator for an innovative three-persona tutoring system that transforms how people learn through active recall and teaching.
+TUTOR_INSTRUCTIONS = """You are the Coordinator for an innovative three-persona tutoring system that transforms how people learn through active recall and teaching.
 
 AVAILABLE TOPICS:
 You have access to these programming topics: Variables, Loops, Functions, and Conditional Statements. When presenting topics to users, mention them naturally and conversationally without listing IDs or full technical names unless asked.
@@ -285,9 +285,13 @@ PEDAGOGICAL PRINCIPLES:
 
 Your ultimate goal: Create magical moments where complex concepts suddenly click, where users feel genuinely excited about learning, and where they walk away not just knowing more, but understanding deeply."""
 
+TUTOR_TOOLS = [select_topic, set_learning_mode, evaluate_teaching]
+
+class TutorAgent(Agent):
+    def __init__(self):
         super().__init__(
-            instructions=instructions,
-            tools=[select_topic, set_learning_mode, evaluate_teaching],
+            instructions=TUTOR_INSTRUCTIONS,
+            tools=TUTOR_TOOLS,
         )
 
 def prewarm(proc: JobProcess):
@@ -297,7 +301,7 @@ async def entrypoint(ctx: JobContext):
     ctx.log_context_fields = {"room": ctx.room.name}
     
     logger.info("Initializing tutoring session")
-    logger.info(f"Loaded {len(COURSE_CONTENT)} topics from curriculum")
+    logger.info("Loaded %d topics from curriculum", len(COURSE_CONTENT))
     
     userdata = Userdata(tutor_state=TutorState())
     